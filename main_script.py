@@ -1,17 +1,43 @@
 import streamlit as st
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import asyncio
+import atexit
+import aiohttp
+import threading
+import hashlib
+import orjson
+import diskcache
+import functools
+import operator
+import re
 from datetime import datetime, timedelta, timezone
-import isodate
-import pytz
+from zoneinfo import ZoneInfo
 import pandas as pd
 import time
+from types import MappingProxyType
 
 st.set_page_config(page_title="YouTube Shorts Finder", page_icon="🎬", layout="wide")
 
 st.title("YouTube Shorts Finder")
 st.markdown("👇 YouTube에서 짧은 영상(Shorts)를 찾고 분석하는 도구입니다.")
 
+# 주요 카테고리 ID (국가마다 다를 수 있음)
+CATEGORIES = MappingProxyType({
+    "영화 & 애니메이션": "1", 
+    "자동차 & 차량": "2", 
+    "음악": "10", 
+    "애완동물 & 동물": "15", 
+    "스포츠": "17", 
+    "여행 & 이벤트": "19", 
+    "게임": "20", 
+    "블로그": "22", 
+    "코미디": "23", 
+    "엔터테인먼트": "24", 
+    "뉴스 & 정치": "25", 
+    "하우투 & 스타일": "26", 
+    "교육": "27", 
+    "과학 & 기술": "28"
+})
+
 # 사이드바 설정
 with st.sidebar:
     st.header("설정")
@@ -47,27 +73,9 @@ with st.sidebar:
     CATEGORY_ENABLED = st.checkbox("특정 카테고리만 검색", value=False, 
                                   help="체크하면 특정 카테고리의 영상만 검색합니다.")
     
-    # 주요 카테고리 ID (국가마다 다를 수 있음)
-    CATEGORIES = {
-        "영화 & 애니메이션": "1", 
-        "자동차 & 차량": "2", 
-        "음악": "10", 
-        "애완동물 & 동물": "15", 
-        "스포츠": "17", 
-        "여행 & 이벤트": "19", 
-        "게임": "20", 
-        "블로그": "22", 
-        "코미디": "23", 
-        "엔터테인먼트": "24", 
-        "뉴스 & 정치": "25", 
-        "하우투 & 스타일": "26", 
-        "교육": "27", 
-        "과학 & 기술": "28"
-    }
-    
     if CATEGORY_ENABLED:
-        CATEGORY_ID = st.selectbox("카테고리", options=list(CATEGORIES.keys()), index=6)
-        CATEGORY_ID = CATEGORIES[CATEGORY_ID]  # ID로 변환
+        CATEGORY_LABEL = st.selectbox("카테고리", options=list(CATEGORIES.keys()), index=6)
+        CATEGORY_ID = CATEGORIES[CATEGORY_LABEL]  # ID로 변환
     else:
         CATEGORY_ID = None
     
@@ -80,49 +88,268 @@ with st.sidebar:
                                 help="영상의 설명, 태그 등 추가 정보를 가져옵니다.")
 
 # 유틸리티 함수
+YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3"
+KST = ZoneInfo('Asia/Seoul')
+# YouTube 영상 길이 형식 (예: PT59S, PT1M30S, P0D)
+DURATION_PATTERN = re.compile(r'P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?')
+MAX_CONCURRENT_REQUESTS = 5  # 동시에 보내는 상세 정보 요청 수
+STREAM_REFRESH_INTERVAL = 10  # 중간 결과 표를 갱신하는 영상 수 간격
+
+# API 응답 캐시 설정 (초 단위 TTL)
+CACHE_DIR = ".api_cache"
+SEARCH_CACHE_TTL = 60  # 검색 결과는 최신 영상 위주라 빠르게 바뀜
+VIDEOS_CACHE_TTL = 6 * 60 * 60  # 영상 상세 정보는 거의 변하지 않음
+
+# videos.list 부분 응답 필드 (fields 파라미터)
+VIDEO_FIELDS = 'items(id,snippet(title,channelTitle,publishedAt),contentDetails/duration,statistics(viewCount,likeCount,commentCount))'
+VIDEO_DETAIL_FIELDS = ('items(id,snippet(title,channelTitle,publishedAt,description,tags,categoryId,defaultLanguage),'
+                       'contentDetails/duration,statistics(viewCount,likeCount,commentCount),topicDetails/topicCategories)')
+
+# videos.list 응답 항목 접근자 (모듈 로드 시 한 번만 생성)
+get_id_and_snippet = operator.itemgetter('id', 'snippet')
+get_snippet_basics = operator.itemgetter('title', 'channelTitle', 'publishedAt')
+
+# videos.list 응답을 평탄화했을 때 사용하는 컬럼
+VIDEO_ITEM_COLUMNS = [
+    'id', 'snippet.title', 'snippet.channelTitle', 'snippet.publishedAt', 'snippet.description',
+    'snippet.tags', 'snippet.defaultLanguage', 'snippet.categoryId', 'contentDetails.duration',
+    'statistics.viewCount', 'statistics.likeCount', 'statistics.commentCount',
+    'topicDetails.topicCategories'
+]
+
+class YouTubeAPIError(Exception):
+    """YouTube Data API 오류 응답"""
+
+class YouTubeClient:
+    """YouTube Data API v3 비동기 클라이언트 (aiohttp 기반)
+    
+    연결 풀을 검색 간에 재사용하기 위해 전용 이벤트 루프 스레드에서 세션을 유지합니다.
+    """
+    MAX_RETRIES = 3
+    BACKOFF_FACTOR = 0.3
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self._session = None
+        self._inflight = {}  # 진행 중인 요청 (클라이언트 루프에서만 접근하므로 잠금 불필요)
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
+    async def get(self, endpoint, params):
+        """API 엔드포인트에 GET 요청을 보내고 JSON 응답 반환"""
+        future = asyncio.run_coroutine_threadsafe(self._coalesced_request(endpoint, params), self._loop)
+        return await asyncio.wrap_future(future)
+
+    async def _coalesced_request(self, endpoint, params):
+        """동일한 요청이 이미 진행 중이면 새로 보내지 않고 그 응답을 함께 기다림"""
+        # 중복 클릭/재실행 시에도 키가 같도록 검색 기간(publishedAfter)은 get_time_range에서 분 단위로 고정됨
+        key = request_key(endpoint, params)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request(endpoint, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 한 호출자가 취소되어도 공유 요청은 계속 진행
+        return await asyncio.shield(task)
+
+    async def _request(self, endpoint, params):
+        """클라이언트 루프에서 실행되는 실제 요청 (일시적 오류 시 지수 백오프로 재시도)"""
+        if self._session is None:
+            # YouTube API 호스트 전용 연결 풀 (유휴 연결을 유지하여 재실행 간 TLS 핸드셰이크 생략)
+            connector = aiohttp.TCPConnector(limit=10, limit_per_host=10, keepalive_timeout=60,
+                                             enable_cleanup_closed=True)
+            self._session = aiohttp.ClientSession(connector=connector)
+        
+        url = f"{YOUTUBE_API_URL}/{endpoint}"
+        for attempt in range(self.MAX_RETRIES + 1):
+            retry_delay = self.BACKOFF_FACTOR * (2 ** attempt)
+            try:
+                async with self._session.get(url, params={**params, 'key': self.api_key}) as response:
+                    if response.status in self.RETRY_STATUSES and attempt < self.MAX_RETRIES:
+                        await asyncio.sleep(retry_delay)
+                        continue
+                    data = orjson.loads(await response.read())
+                    if response.status != 200:
+                        message = data.get('error', {}).get('message', response.reason)
+                        raise YouTubeAPIError(f"{response.status} {message}")
+                    return data
+            except aiohttp.ClientConnectionError:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                await asyncio.sleep(retry_delay)
+
+    def close(self):
+        """세션을 닫고 클라이언트 이벤트 루프 종료"""
+        if self._session is not None:
+            asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result(timeout=5)
+            self._session = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+@st.cache_resource(show_spinner=False)
 def get_youtube_client(api_key):
-    """YouTube API 클라이언트 생성"""
+    """YouTube API 클라이언트 생성 (API 키별로 한 번만 생성하여 재실행 간 공유)"""
     try:
-        youtube = build('youtube', 'v3', developerKey=api_key)
+        youtube = YouTubeClient(api_key)
+        atexit.register(youtube.close)  # 프로세스 종료 시 연결 정리
         return youtube
     except Exception as e:
         st.error(f"API 클라이언트 생성 중 오류: {str(e)}")
         return None
 
+@st.cache_resource(show_spinner=False)
+def get_response_cache():
+    """API 응답 캐시 생성 (diskcache, 재실행 및 세션 간 공유)"""
+    return diskcache.Cache(CACHE_DIR)
+
+def request_key(endpoint, params):
+    """엔드포인트와 요청 파라미터로 캐시 키 생성"""
+    raw = endpoint.encode('utf-8') + orjson.dumps(sorted(params.items()))
+    return hashlib.sha1(raw).hexdigest()
+
+async def cached_api_call(youtube, endpoint, params, ttl):
+    """TTL 캐시를 거쳐 API 호출 (캐시 적중 시 요청 생략)"""
+    cache = get_response_cache()
+    key = request_key(endpoint, params)
+    response = cache.get(key)
+    if response is None:
+        response = await youtube.get(endpoint, params)
+        cache.set(key, response, expire=ttl)
+    return response
+
 def get_time_range(hours_ago):
-    """특정 시간 전부터 현재까지의 시간 범위 생성"""
+    """특정 시간 전부터 현재까지의 시간 범위 생성
+    
+    분 단위로 내림하여 같은 검색을 반복해도 요청 파라미터(캐시 키)가 바뀌지 않도록 합니다.
+    """
     now = datetime.now(timezone.utc)
-    past_time = now - timedelta(hours=hours_ago)
+    past_time = (now - timedelta(hours=hours_ago)).replace(second=0, microsecond=0)
     return past_time.strftime('%Y-%m-%dT%H:%M:%SZ')
 
+@functools.lru_cache(maxsize=4096)
 def convert_to_kst(utc_time_str):
-    """UTC 시간을 한국 시간(KST)으로 변환"""
+    """UTC 시간 문자열을 한국 시간(KST) datetime으로 변환 (실패 시 None)"""
     try:
-        utc_time = datetime.strptime(utc_time_str, '%Y-%m-%dT%H:%M:%SZ')
-        utc_time = utc_time.replace(tzinfo=timezone.utc)
-        kst = pytz.timezone('Asia/Seoul')
-        kst_time = utc_time.astimezone(kst)
-        return kst_time.strftime('%Y-%m-%d %H:%M:%S KST')
+        utc_time = datetime.fromisoformat(utc_time_str.replace('Z', '+00:00'))
+        return utc_time.astimezone(KST)
     except Exception as e:
-        return utc_time_str
+        return None
+
+def format_kst(kst_time):
+    """KST datetime을 표시용 문자열로 포맷팅"""
+    return kst_time.strftime('%Y-%m-%d %H:%M:%S KST') if kst_time else ''
 
+@functools.lru_cache(maxsize=4096)
 def duration_to_seconds(duration_str):
     """영상 길이(ISO 8601 형식)를 초 단위로 변환"""
-    if not duration_str:
-        return 0
-    try:
-        return isodate.parse_duration(duration_str).total_seconds()
-    except Exception as e:
+    match = DURATION_PATTERN.fullmatch(duration_str) if duration_str else None
+    if not match:
         return 0
+    days, hours, minutes, seconds = match.groups()
+    return int(days or 0) * 86400 + int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(seconds or 0)
 
 def format_number(number):
     """숫자를 천 단위 구분자로 포맷팅"""
     return f"{number:,}"
 
-def search_recent_short_videos(youtube, hours_ago, max_duration, min_views, region, max_results, category_id=None, search_method="최신순", include_details=True):
-    """최근 짧은 영상 검색"""
+def hourly_histogram(videos):
+    """KST 업로드 시간대(0~23시)별 영상 수 집계 (영상이 없는 시간대는 0)"""
+    hours = pd.DataFrame(videos)['업로드 시간대']
+    counts = hours.value_counts().reindex(range(24), fill_value=0)
+    return counts.rename_axis('시간').rename('영상 수')
+
+def flatten_video_items(items):
+    """videos.list 응답 항목에서 사용하는 필드만 꺼내 평탄화된 데이터프레임으로 변환"""
+    if not items:
+        return pd.DataFrame(columns=VIDEO_ITEM_COLUMNS)
+    
+    ids, snippets = zip(*map(get_id_and_snippet, items))
+    titles, channels, published = zip(*map(get_snippet_basics, snippets))
+    statistics = [item.get('statistics', {}) for item in items]
+    
+    return pd.DataFrame({
+        'id': ids,
+        'snippet.title': titles,
+        'snippet.channelTitle': channels,
+        'snippet.publishedAt': published,
+        'snippet.description': [snippet.get('description') for snippet in snippets],
+        'snippet.tags': [snippet.get('tags') for snippet in snippets],
+        'snippet.defaultLanguage': [snippet.get('defaultLanguage') for snippet in snippets],
+        'snippet.categoryId': [snippet.get('categoryId') for snippet in snippets],
+        'contentDetails.duration': [item.get('contentDetails', {}).get('duration') for item in items],
+        'statistics.viewCount': [stat.get('viewCount') for stat in statistics],
+        'statistics.likeCount': [stat.get('likeCount') for stat in statistics],
+        'statistics.commentCount': [stat.get('commentCount') for stat in statistics],
+        'topicDetails.topicCategories': [item.get('topicDetails', {}).get('topicCategories') for item in items]
+    }, columns=VIDEO_ITEM_COLUMNS)
+
+def build_video_frame(items, max_duration, min_views, include_details=True):
+    """videos.list 응답 항목을 길이/조회수 기준으로 필터링하여 데이터프레임으로 변환"""
+    raw = flatten_video_items(items)
+    duration_seconds = raw['contentDetails.duration'].fillna('').map(duration_to_seconds)
+    statistics = raw[['statistics.viewCount', 'statistics.likeCount', 'statistics.commentCount']]
+    statistics = statistics.apply(pd.to_numeric, errors='coerce').fillna(0).astype('int64')
+    
+    # 길이 및 조회수 기준 필터링
+    mask = (duration_seconds <= max_duration) & (statistics['statistics.viewCount'] >= min_views)
+    raw, duration_seconds, statistics = raw[mask], duration_seconds[mask], statistics[mask]
+    
+    # 게시 시각은 한 번만 변환하여 표시 문자열과 업로드 시간대에 함께 사용
+    # (리스트로 처리하여 변환 실패(None)가 NaT로 바뀌지 않도록 하고, 실패 시 원본 문자열 표시)
+    published = raw['snippet.publishedAt'].tolist()
+    published_kst = [convert_to_kst(published_at) for published_at in published]
+    
+    # 기본 정보 수집
+    frame = pd.DataFrame({
+        '제목': raw['snippet.title'],
+        '채널명': raw['snippet.channelTitle'],
+        '게시일': raw['snippet.publishedAt'],
+        '게시일(KST)': [format_kst(kst_time) if kst_time else published_at
+                       for published_at, kst_time in zip(published, published_kst)],
+        '업로드 시간대': pd.array([kst_time.hour if kst_time else None for kst_time in published_kst], dtype='Int64'),
+        '조회수': statistics['statistics.viewCount'],
+        '좋아요': statistics['statistics.likeCount'],
+        '댓글수': statistics['statistics.commentCount'],
+        '영상 길이(초)': duration_seconds.round(1),
+        '영상 ID': raw['id'],
+        'URL': raw['id'].map("https://www.youtube.com/watch?v={}".format)
+    })
+    
+    # 상세 정보 추가 (선택적)
+    if include_details:
+        join_list = lambda values: ', '.join(values) if isinstance(values, list) else ''
+        frame['설명'] = raw['snippet.description'].fillna('')
+        frame['태그'] = raw['snippet.tags'].map(join_list)
+        frame['기본 언어'] = raw['snippet.defaultLanguage'].fillna('')
+        frame['카테고리 ID'] = raw['snippet.categoryId'].fillna('')
+        frame['토픽 카테고리'] = raw['topicDetails.topicCategories'].map(join_list)
+    
+    return frame
+
+async def fetch_video_details(youtube, video_ids, semaphore, include_details=True):
+    """검색 페이지 하나의 영상 ID(최대 50개, videos.list 한도)로 상세 정보 조회
+    
+    semaphore는 검색 하나에서 공유하여 동시에 보내는 상세 정보 요청 수를 제한합니다.
+    """
+    # 비디오 상세 정보 요청에 포함할 부분 설정 (응답은 실제 사용하는 필드로 제한)
+    video_parts = ['snippet', 'contentDetails', 'statistics']
+    video_fields = VIDEO_FIELDS
+    if include_details:
+        video_parts.append('topicDetails')
+        video_fields = VIDEO_DETAIL_FIELDS
+    
+    async with semaphore:
+        response = await cached_api_call(youtube, 'videos', {
+            'part': ','.join(video_parts),
+            'fields': video_fields,
+            'id': ','.join(video_ids)
+        }, VIDEOS_CACHE_TTL)
+    return response.get('items', [])
+
+async def search_recent_short_videos(youtube, hours_ago, max_duration, min_views, region, max_results, category_id=None, search_method="최신순", include_details=True):
+    """최근 짧은 영상 검색 (조건을 만족하는 영상을 찾는 대로 하나씩 반환)"""
     if not youtube:
-        return []
+        return
     
     published_after = get_time_range(hours_ago)
     
@@ -131,151 +358,118 @@ def search_recent_short_videos(youtube, hours_ago, max_duration, min_views, regi
     progress_bar = st.progress(0)
     progress_text.text("검색 준비 중...")
     
-    # 검색 파라미터 설정
+    # 검색 파라미터 설정 (search API 사용, 기간/길이/카테고리는 서버에서 필터링)
+    page_params = {
+        'part': 'id',
+        'fields': 'items(id/videoId),nextPageToken',  # 비디오 ID만 응답
+        'maxResults': min(max_results, 50),  # API 한도
+        'type': 'video',
+        'videoDuration': 'short',  # 4분 미만 영상 (API 기본 필터)
+        'publishedAfter': published_after,
+        'regionCode': region
+    }
+    
+    if category_id:
+        page_params['videoCategoryId'] = category_id
+    
     if search_method == "최신순":
-        # search API 사용 (최신 영상 검색)
-        search_params = {
-            'part': 'snippet',
-            'maxResults': min(max_results, 50),  # API 한도
-            'type': 'video',
-            'videoDuration': 'short',  # 4분 미만 영상 (API 기본 필터)
-            'order': 'date',  # 최신 영상 우선
-            'publishedAfter': published_after,
-            'regionCode': region
-        }
-        
-        if category_id:
-            search_params['videoCategoryId'] = category_id
-        
+        page_params['order'] = 'date'  # 최신 영상 우선
         progress_text.text(f"최근 {hours_ago}시간 이내 업로드된 영상 검색 중...")
-        progress_bar.progress(10)
-        
-        try:
-            # 검색 실행
-            search_response = youtube.search().list(**search_params).execute()
-            
-            if not search_response.get('items'):
-                progress_text.text("검색 결과가 없습니다.")
-                progress_bar.progress(100)
-                return []
-            
-            # 비디오 ID 수집
-            video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
-            
-        except HttpError as e:
-            progress_text.text(f"API 오류: {str(e)}")
-            progress_bar.progress(100)
-            return []
-            
     else:  # 인기순
-        # videos.list API에서 인기 영상 직접 가져오기
-        videos_params = {
-            'part': 'snippet,contentDetails,statistics',
-            'chart': 'mostPopular',
-            'regionCode': region,
-            'maxResults': min(max_results, 50)  # API 한도
-        }
-        
-        if category_id:
-            videos_params['videoCategoryId'] = category_id
-        
-        progress_text.text(f"인기 영상 검색 중...")
-        progress_bar.progress(10)
-        
-        try:
-            popular_response = youtube.videos().list(**videos_params).execute()
-            
-            if not popular_response.get('items'):
-                progress_text.text("검색 결과가 없습니다.")
-                progress_bar.progress(100)
-                return []
-                
-            # 가져온 영상을 60초 이하 & 설정된 시간 이내 필터링
-            video_ids = []
-            for item in popular_response.get('items', []):
-                duration = item['contentDetails']['duration']
-                duration_seconds = duration_to_seconds(duration)
-                published_at = item['snippet']['publishedAt']
-                
-                # 영상 길이가 max_duration 이하이고, 설정된 시간 이내에 업로드된 경우만 포함
-                if duration_seconds <= max_duration and published_at >= published_after:
-                    video_ids.append(item['id'])
-        
-        except HttpError as e:
-            progress_text.text(f"API 오류: {str(e)}")
-            progress_bar.progress(100)
-            return []
-    
-    # 비디오 상세 정보 가져오기
-    progress_text.text("영상 상세 정보 가져오는 중...")
-    progress_bar.progress(30)
+        page_params['order'] = 'viewCount'  # 조회수 높은 영상 우선
+        progress_text.text(f"최근 {hours_ago}시간 이내 인기 영상 검색 중...")
     
-    # 비디오 상세 정보 요청에 포함할 부분 설정
-    video_parts = ['snippet', 'contentDetails', 'statistics']
-    if include_details:
-        video_parts.extend(['topicDetails', 'recordingDetails'])
+    progress_bar.progress(10)
     
-    videos_found = []
+    fetched_count = 0
+    found_count = 0
+    error_message = None
+    seen_ids = set()
+    stop_paging = False
     
     try:
-        if video_ids:
-            video_response = youtube.videos().list(
-                part=','.join(video_parts),
-                id=','.join(video_ids)
-            ).execute()
-            
-            progress_text.text("데이터 처리 중...")
-            progress_bar.progress(60)
+        page_task = asyncio.create_task(cached_api_call(youtube, 'search', page_params, SEARCH_CACHE_TTL))
+        detail_tasks = set()
+        details_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        # 검색 페이지는 순서대로, 각 페이지의 상세 정보는 도착하는 대로 병렬 처리
+        while page_task or detail_tasks:
+            pending = detail_tasks | {page_task} if page_task else detail_tasks
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
             
-            # 처리 및 필터링
-            for item in video_response.get('items', []):
-                duration = item['contentDetails']['duration']
-                duration_seconds = duration_to_seconds(duration)
-                view_count = int(item['statistics'].get('viewCount', 0))
-                
-                # 길이 및 조회수 기준 필터링
-                if duration_seconds <= max_duration and view_count >= min_views:
-                    published_at = item['snippet']['publishedAt']
+            for task in done:
+                if task in detail_tasks:
+                    detail_tasks.discard(task)
+                    video_items = task.result()
                     
-                    # 기본 정보 수집
-                    video_info = {
-                        '제목': item['snippet']['title'],
-                        '채널명': item['snippet']['channelTitle'],
-                        '게시일': published_at,
-                        '게시일(KST)': convert_to_kst(published_at),
-                        '조회수': view_count,
-                        '좋아요': int(item['statistics'].get('likeCount', 0)),
-                        '댓글수': int(item['statistics'].get('commentCount', 0)),
-                        '영상 길이(초)': round(duration_seconds, 1),
-                        '영상 ID': item['id'],
-                        'URL': f"https://www.youtube.com/watch?v={item['id']}"
-                    }
+                    # 처리 및 필터링 후 찾는 대로 반환
+                    if video_items:
+                        for video_info in build_video_frame(video_items, max_duration, min_views, include_details).to_dict('records'):
+                            found_count += 1
+                            yield video_info
                     
-                    # 상세 정보 추가 (선택적)
-                    if include_details:
-                        video_info['설명'] = item['snippet'].get('description', '')
-                        video_info['태그'] = ', '.join(item['snippet'].get('tags', []))
-                        video_info['기본 언어'] = item['snippet'].get('defaultLanguage', '')
-                        video_info['카테고리 ID'] = item['snippet'].get('categoryId', '')
-                        
-                        if 'topicDetails' in item:
-                            video_info['토픽 카테고리'] = ', '.join(item['topicDetails'].get('topicCategories', []))
+                    # 인기순은 조회수 내림차순이므로 최소 조회수 미만 영상이 나오면 이후 페이지는 볼 필요 없음
+                    if search_method == "인기순" and any(int(item.get('statistics', {}).get('viewCount', 0)) < min_views for item in video_items):
+                        stop_paging = True
+                elif not stop_paging:
+                    page_response = task.result()
+                    items = page_response.get('items', [])
+                    fetched_count += len(items)
                     
-                    videos_found.append(video_info)
-            
-            # 조회수 기준 정렬
-            videos_found.sort(key=lambda x: x['조회수'], reverse=True)
+                    # 현재 페이지를 처리하는 동안 다음 페이지를 미리 요청
+                    page_task = None
+                    next_page_token = page_response.get('nextPageToken')
+                    if next_page_token and fetched_count < max_results:
+                        page_task = asyncio.create_task(cached_api_call(youtube, 'search', {
+                            **page_params,
+                            'pageToken': next_page_token,
+                            'maxResults': min(max_results - fetched_count, 50)
+                        }, SEARCH_CACHE_TTL))
+                    
+                    # 비디오 ID 수집 및 상세 정보 요청 (페이지 간 중복 ID 제거)
+                    video_ids = [item['id']['videoId'] for item in items]
+                    video_ids = [video_id for video_id in dict.fromkeys(video_ids) if video_id not in seen_ids]
+                    seen_ids.update(video_ids)
+                    if video_ids:
+                        detail_tasks.add(asyncio.create_task(fetch_video_details(youtube, video_ids, details_semaphore, include_details)))
+                    
+                    progress_text.text(f"영상 검색 중... ({fetched_count}개 확인, {found_count}개 발견)")
+                    progress_bar.progress(min(10 + int(80 * fetched_count / max_results), 90))
             
-    except HttpError as e:
-        progress_text.text(f"API 오류: {str(e)}")
+            if stop_paging and page_task:
+                page_task.cancel()
+                page_task = None
+        
+    except (YouTubeAPIError, aiohttp.ClientError) as e:
+        error_message = f"API 오류: {str(e)}"
     except Exception as e:
-        progress_text.text(f"처리 중 오류 발생: {str(e)}")
+        error_message = f"처리 중 오류 발생: {str(e)}"
     
-    progress_text.text(f"검색 완료! {len(videos_found)}개의 영상을 찾았습니다.")
+    if not error_message and fetched_count == 0:
+        error_message = "검색 결과가 없습니다."
+    progress_text.text(error_message or f"검색 완료! {found_count}개의 영상을 찾았습니다.")
     progress_bar.progress(100)
+
+async def collect_search_results(table_placeholder, display_columns, **search_kwargs):
+    """검색 결과를 찾는 대로 모으면서 중간 결과를 표로 표시한 뒤 조회수 순으로 정렬하여 반환"""
+    videos = []
+    async for video_info in search_recent_short_videos(**search_kwargs):
+        videos.append(video_info)
+        if len(videos) % STREAM_REFRESH_INTERVAL == 0:
+            table_placeholder.dataframe(pd.DataFrame(videos)[display_columns], use_container_width=True)
     
-    return videos_found
+    # 조회수 기준 정렬
+    if videos:
+        videos = pd.DataFrame(videos).sort_values('조회수', ascending=False, kind='stable').to_dict('records')
+    return videos
+
 
+# 현재 검색 설정 (저장된 결과를 재사용할 수 있는지 판단하는 기준)
+SEARCH_SIGNATURE = (HOURS_AGO, MAX_DURATION_SECONDS, MIN_VIEW_COUNT, REGION_CODE, MAX_RESULTS,
+                    CATEGORY_ID, SEARCH_METHOD, INCLUDE_DETAILS)
+
+# 표시할 컬럼
+display_columns = ['제목', '채널명', '게시일(KST)', '조회수', '좋아요', '영상 길이(초)', 'URL']
 
 # 실행 버튼
 if st.button("검색 시작", type="primary"):
@@ -287,10 +481,13 @@ if st.button("검색 시작", type="primary"):
         
         if youtube:
             with st.spinner("검색 중입니다..."):
-                # 검색 실행
+                # 검색 실행 (찾는 대로 중간 결과 표시)
                 start_time = time.time()
+                table_placeholder = st.empty()
                 
-                videos = search_recent_short_videos(
+                videos = asyncio.run(collect_search_results(
+                    table_placeholder,
+                    display_columns,
                     youtube=youtube,
                     hours_ago=HOURS_AGO,
                     max_duration=MAX_DURATION_SECONDS,
@@ -300,105 +497,105 @@ if st.button("검색 시작", type="primary"):
                     category_id=CATEGORY_ID,
                     search_method=SEARCH_METHOD,
                     include_details=INCLUDE_DETAILS
-                )
+                ))
+                table_placeholder.empty()
                 
                 search_time = time.time() - start_time
-                
-                # 결과 표시
-                if videos:
-                    st.success(f"{len(videos)}개의 영상을 찾았습니다! (검색 시간: {search_time:.2f}초)")
-                    
-                    # 데이터프레임으로 변환
-                    df = pd.DataFrame(videos)
-                    
-                    # 통계 정보
-                    st.header("통계 정보")
-                    col1, col2, col3, col4 = st.columns(4)
-                    with col1:
-                        st.metric("총 영상 수", f"{len(videos)}개")
-                    with col2:
-                        st.metric("평균 조회수", f"{int(df['조회수'].mean()):,}")
-                    with col3:
-                        st.metric("평균 좋아요", f"{int(df['좋아요'].mean()):,}")
-                    with col4:
-                        st.metric("평균 영상 길이", f"{df['영상 길이(초)'].mean():.1f}초")
-                    
-                    # 영상 목록
-                    st.header("영상 목록")
-                    
-                    # 표시할 컬럼
-                    display_columns = ['제목', '채널명', '게시일(KST)', '조회수', '좋아요', '영상 길이(초)', 'URL']
-                    
-                    # 조회수, 좋아요수 포맷팅
-                    df_display = df.copy()
-                    df_display['조회수'] = df_display['조회수'].apply(format_number)
-                    df_display['좋아요'] = df_display['좋아요'].apply(format_number)
-                    
-                    # 테이블로 표시
-                    st.dataframe(df_display[display_columns], use_container_width=True, 
-                                height=400, column_config={
-                                    'URL': st.column_config.LinkColumn(),
-                                    '제목': st.column_config.Column(width="large")
-                                })
-                    
-                    # CSV 다운로드 버튼
-                    csv = df.to_csv(index=False).encode('utf-8')
-                    st.download_button(
-                        label="CSV로 다운로드",
-                        data=csv,
-                        file_name=f"youtube_shorts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv"
-                    )
-                    
-                    # 시각화
-                    st.header("시각화")
-                    chart_tab1, chart_tab2, chart_tab3 = st.tabs(["조회수 분포", "길이 분포", "시간대별 업로드"])
-                    
-                    with chart_tab1:
-                        # 조회수 구간별 분류
-                        view_bins = [0, 10000, 50000, 100000, 500000, 1000000, float('inf')]
-                        view_labels = ['1만 미만', '1만-5만', '5만-10만', '10만-50만', '50만-100만', '100만 이상']
-                        df['조회수 구간'] = pd.cut(df['조회수'], bins=view_bins, labels=view_labels)
-                        view_counts = df['조회수 구간'].value_counts().sort_index()
-                        
-                        st.bar_chart(view_counts)
-                    
-                    with chart_tab2:
-                        # 영상 길이 분포
-                        length_bins = [0, 15, 30, 45, 60, float('inf')]
-                        length_labels = ['0-15초', '15-30초', '30-45초', '45-60초', '60초 이상']
-                        df['길이 구간'] = pd.cut(df['영상 길이(초)'], bins=length_bins, labels=length_labels)
-                        length_counts = df['길이 구간'].value_counts().sort_index()
-                        
-                        st.bar_chart(length_counts)
-                    
-                    with chart_tab3:
-                        # 시간대별 업로드 분포
-                        df['시간대'] = pd.to_datetime(df['게시일']).dt.hour
-                        hour_counts = df['시간대'].value_counts().sort_index()
-                        hour_df = pd.DataFrame({'시간': hour_counts.index, '영상 수': hour_counts.values})
-                        
-                        st.bar_chart(hour_df.set_index('시간'))
-
-                    # 영상 미리보기 (선택적)
-                    if st.checkbox("영상 미리보기 보기"):
-                        st.header("영상 미리보기")
-                        # 상위 3개 영상만 미리보기 표시
-                        for i, video in enumerate(videos[:3]):
-                            col1, col2 = st.columns([2, 3])
-                            with col1:
-                                st.video(video['URL'])
-                            with col2:
-                                st.subheader(video['제목'])
-                                st.write(f"채널: {video['채널명']}")
-                                st.write(f"조회수: {format_number(video['조회수'])}")
-                                st.write(f"좋아요: {format_number(video['좋아요'])}")
-                                st.write(f"길이: {video['영상 길이(초)']}초")
-                                st.write(f"게시일: {video['게시일(KST)']}")
-                            st.divider()
-                
-                else:
-                    st.warning("검색 조건을 만족하는 영상을 찾지 못했습니다. 검색 조건을 변경해보세요.")
+            
+            # 결과 저장 (미리보기 체크박스 등 다른 위젯 조작으로 재실행되어도 다시 검색하지 않음)
+            st.session_state['videos'] = videos
+            st.session_state['search_time'] = search_time
+            st.session_state['search_signature'] = SEARCH_SIGNATURE
+
+# 결과 표시 (현재 설정으로 검색한 결과가 있을 때만)
+if st.session_state.get('search_signature') == SEARCH_SIGNATURE:
+    videos = st.session_state['videos']
+    search_time = st.session_state['search_time']
+    
+    if videos:
+        st.success(f"{len(videos)}개의 영상을 찾았습니다! (검색 시간: {search_time:.2f}초)")
+        
+        # 데이터프레임으로 변환
+        df = pd.DataFrame(videos)
+        
+        # 통계 정보
+        st.header("통계 정보")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("총 영상 수", f"{len(videos)}개")
+        with col2:
+            st.metric("평균 조회수", f"{int(df['조회수'].mean()):,}")
+        with col3:
+            st.metric("평균 좋아요", f"{int(df['좋아요'].mean()):,}")
+        with col4:
+            st.metric("평균 영상 길이", f"{df['영상 길이(초)'].mean():.1f}초")
+        
+        # 영상 목록
+        st.header("영상 목록")
+        
+        # 테이블로 표시 (조회수, 좋아요수는 복사 없이 천 단위 구분자로 표시)
+        st.dataframe(df[display_columns], use_container_width=True, 
+                    height=400, column_config={
+                        'URL': st.column_config.LinkColumn(),
+                        '제목': st.column_config.Column(width="large"),
+                        '조회수': st.column_config.NumberColumn(format="localized"),
+                        '좋아요': st.column_config.NumberColumn(format="localized")
+                    })
+        
+        # CSV 다운로드 버튼
+        csv = df.to_csv(index=False).encode('utf-8')
+        st.download_button(
+            label="CSV로 다운로드",
+            data=csv,
+            file_name=f"youtube_shorts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv"
+        )
+        
+        # 시각화
+        st.header("시각화")
+        chart_tab1, chart_tab2, chart_tab3 = st.tabs(["조회수 분포", "길이 분포", "시간대별 업로드"])
+        
+        with chart_tab1:
+            # 조회수 구간별 분류
+            view_bins = [0, 10000, 50000, 100000, 500000, 1000000, float('inf')]
+            view_labels = ['1만 미만', '1만-5만', '5만-10만', '10만-50만', '50만-100만', '100만 이상']
+            df['조회수 구간'] = pd.cut(df['조회수'], bins=view_bins, labels=view_labels)
+            view_counts = df['조회수 구간'].value_counts().sort_index()
+            
+            st.bar_chart(view_counts)
+        
+        with chart_tab2:
+            # 영상 길이 분포
+            length_bins = [0, 15, 30, 45, 60, float('inf')]
+            length_labels = ['0-15초', '15-30초', '30-45초', '45-60초', '60초 이상']
+            df['길이 구간'] = pd.cut(df['영상 길이(초)'], bins=length_bins, labels=length_labels)
+            length_counts = df['길이 구간'].value_counts().sort_index()
+            
+            st.bar_chart(length_counts)
+        
+        with chart_tab3:
+            # 시간대별 업로드 분포
+            st.bar_chart(hourly_histogram(df))
+
+        # 영상 미리보기 (선택적)
+        if st.checkbox("영상 미리보기 보기"):
+            st.header("영상 미리보기")
+            # 상위 3개 영상만 미리보기 표시
+            for i, video in enumerate(videos[:3]):
+                col1, col2 = st.columns([2, 3])
+                with col1:
+                    st.video(video['URL'])
+                with col2:
+                    st.subheader(video['제목'])
+                    st.write(f"채널: {video['채널명']}")
+                    st.write(f"조회수: {format_number(video['조회수'])}")
+                    st.write(f"좋아요: {format_number(video['좋아요'])}")
+                    st.write(f"길이: {video['영상 길이(초)']}초")
+                    st.write(f"게시일: {video['게시일(KST)']}")
+                st.divider()
+    
+    else:
+        st.warning("검색 조건을 만족하는 영상을 찾지 못했습니다. 검색 조건을 변경해보세요.")
 
 # 하단 정보
 st.markdown("---")